@@ -56,6 +56,9 @@ PrefixT = t.Union[
     t.Sequence[str],
     t.Callable[["BotApp", hikari.Message], t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]],
 ]
+_PrefixGetterT = t.Callable[
+    ["BotApp", hikari.Message], t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]
+]
 CheckCoroT = t.TypeVar("CheckCoroT", bound=t.Callable[..., t.Union[bool, t.Coroutine[t.Any, t.Any, bool]]])
 
 
@@ -117,32 +120,120 @@ def when_mentioned_or(
             app = lightbulb.BotApp(prefix=lightbulb.when_mentioned_or(get_prefix), ...)
     """
 
+    # Prefixes that aren't supplied by a callable never change, so they only need to be normalised once
+    static_prefixes = None if callable(prefix_provider) else _prefixes_to_list(prefix_provider)
+
     async def get_prefixes(app: BotApp, message: hikari.Message) -> t.Sequence[str]:
         me = app.get_me()
         assert me is not None
         mentions = [f"<@{me.id}> ", f"<@!{me.id}> "]
 
-        if callable(prefix_provider):
-            prefixes = prefix_provider(app, message)
-            if inspect.iscoroutine(prefixes):
-                prefixes = await prefixes
-        else:
-            prefixes = prefix_provider
+        if static_prefixes is not None:
+            return mentions + static_prefixes
 
-        if isinstance(prefixes, str):
-            return mentions + [prefixes]
-        elif isinstance(prefixes, t.Sequence):
-            return mentions + list(prefixes)
-        return mentions
+        assert callable(prefix_provider)
+        prefixes = prefix_provider(app, message)
+        if inspect.iscoroutine(prefixes):
+            prefixes = await prefixes
+        return mentions + _prefixes_to_list(t.cast(t.Optional[t.Sequence[str]], prefixes))
 
     return get_prefixes
 
 
+def _prefixes_to_list(prefixes: t.Optional[t.Sequence[str]]) -> t.List[str]:
+    if prefixes is None:
+        return []
+    if isinstance(prefixes, str):
+        return [prefixes]
+    return list(prefixes)
+
+
 # str is by definition a sequence of str so these type hints are correct
 def _default_get_prefix(_: BotApp, __: hikari.Message, *, prefixes: t.Sequence[str]) -> t.Sequence[str]:
     return prefixes
 
 
+class _PrefixTrie:
+    """Character trie of command prefixes, allowing the longest matching prefix to be found in a single pass."""
+
+    __slots__ = ("_root", "_prefixes", "max_length")
+
+    # Chars are never the empty string, so it is safe to use as the key marking the end of a prefix
+    _END = ""
+
+    def __init__(self, prefixes: t.Iterable[str] = ()) -> None:
+        self._root: t.Dict[str, t.Any] = {}
+        prefix_list: t.List[str] = []
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[self._END] = prefix
+            prefix_list.append(prefix)
+
+        self._prefixes: t.Tuple[str, ...] = tuple(prefix_list)
+        self.max_length: int = max(map(len, prefix_list), default=0)
+
+    def has_prefix(self, content: str) -> bool:
+        # Most messages are not commands - str.startswith can reject them without walking the trie
+        return content.startswith(self._prefixes)
+
+    def match(self, content: str) -> t.Optional[str]:
+        node = self._root
+        matched: t.Optional[str] = node.get(self._END)
+        for char in content:
+            if (node := node.get(char)) is None:  # type: ignore[assignment]
+                break
+            matched = node.get(self._END, matched)
+        return matched
+
+
+def _build_prefix_trie(prefixes: t.Sequence[str], case_insensitive: bool = False) -> _PrefixTrie:
+    return _PrefixTrie(map(str.lower, prefixes) if case_insensitive else prefixes)
+
+
+def _match_prefix(prefixes: t.Sequence[str], content: str, case_insensitive: bool) -> t.Optional[str]:
+    # Used for prefixes returned from get_prefix, which can differ for every message, so building
+    # a trie for them would cost more than it saves
+    if case_insensitive:
+        prefixes = [prefix.lower() for prefix in prefixes]
+        content = content[: max(map(len, prefixes), default=0)].lower()
+    prefixes = tuple(prefixes)
+
+    if not content.startswith(prefixes):
+        return None
+
+    matched = ""
+    for prefix in prefixes:
+        if len(prefix) > len(matched) and content.startswith(prefix):
+            matched = prefix
+    return matched
+
+
+def _parse_invocation(trie: _PrefixTrie, content: str, case_insensitive: bool) -> t.Optional[t.Tuple[str, str, str]]:
+    # Only the part of the message that could contain a prefix needs to be lowercased. A char never
+    # gets shorter when lowercased, so this slice always covers the longest prefix.
+    invoked_prefix = trie.match(content[: trie.max_length].lower() if case_insensitive else content)
+    if invoked_prefix is None:
+        return None
+    return _split_invocation(invoked_prefix, content)
+
+
+def _split_invocation(invoked_prefix: str, content: str) -> t.Optional[t.Tuple[str, str, str]]:
+    # An empty list here means that the message consisted only of the prefix and optionally whitespace
+    split_content = content[len(invoked_prefix) :].split(maxsplit=1)
+    if not split_content:
+        return None
+
+    return invoked_prefix, split_content[0], split_content[1] if len(split_content) > 1 else ""
+
+
+# The result only depends on the trie and the message content, so repeated invocations (users repeating
+# commands, spam) can skip parsing entirely. Tries are compared by identity, so no invalidation is needed
+# when the prefixes change.
+_parse_invocation_cached = functools.lru_cache(maxsize=1024)(_parse_invocation)
+
+
 class BotApp(hikari.GatewayBot):
     """
     A subclassed implementation of the :obj:`~hikari.impl.gateway_bot.GatewayBot` class containing a command
@@ -175,9 +266,12 @@ class BotApp(hikari.GatewayBot):
     """  # noqa: E501
 
     __slots__ = (
-        "get_prefix",
+        "_get_prefix",
+        "_get_prefix_is_async",
+        "_static_prefix_trie",
         "ignore_bots",
         "owner_ids",
+        "_owner_id_set",
         "application",
         "d",
         "_prefix_commands",
@@ -211,26 +305,34 @@ class BotApp(hikari.GatewayBot):
         **kwargs: t.Any,
     ) -> None:
         super().__init__(token, **kwargs)
+        self._static_prefix_trie: t.Optional[_PrefixTrie] = None
         # The prefix command handler expects an iterable to be returned from the get_prefix function,
         # so we have to wrap a single string prefix in a list here.
         if prefix is not None:
             prefix = [prefix] if isinstance(prefix, str) else prefix
-            if isinstance(prefix, t.Sequence):
+            static_prefixes = None
+            # Anything that isn't a prefix getter must be a sequence of prefixes
+            if not callable(prefix):
+                static_prefixes = tuple(prefix)
                 # Create the default get prefix from the passed-in prefixes if a get_prefix function
                 # was not provided
                 prefix = functools.partial(_default_get_prefix, prefixes=prefix)
-            self.get_prefix: t.Callable[
-                [BotApp, hikari.Message], t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]
-            ] = prefix
+            self.get_prefix = prefix
 
-        self._delete_unbound_commands = delete_unbound_commands
-        self._case_insensitive_prefixes = case_insensitive_prefixes
-        self._case_insensitive_prefix_commands = case_insensitive_prefix_commands
+            if static_prefixes is not None:
+                # Static prefixes never change, so the message handler can use them directly without
+                # having to call get_prefix for every message
+                self._static_prefix_trie = _build_prefix_trie(static_prefixes, case_insensitive_prefixes)
+
+        self._delete_unbound_commands: bool = delete_unbound_commands
+        self._case_insensitive_prefixes: bool = case_insensitive_prefixes
+        self._case_insensitive_prefix_commands: bool = case_insensitive_prefix_commands
 
         self.ignore_bots: bool = ignore_bots
         """Whether or not other bots will be ignored when invoking prefix commands."""
         self.owner_ids: t.Sequence[int] = owner_ids
         """The owner ID(s) for the owner(s) of the bot account."""
+        self._owner_id_set: t.Optional[t.Tuple[t.Sequence[int], t.FrozenSet[int]]] = None
         self.default_enabled_guilds: t.Sequence[int] = (
             (default_enabled_guilds,) if isinstance(default_enabled_guilds, int) else default_enabled_guilds
         )
@@ -284,7 +386,7 @@ class BotApp(hikari.GatewayBot):
 
         # We need to store created tasks internally to ensure that they do not
         # get destroyed mid-execution. See asyncio.create_task documentation for more.
-        self._running_tasks: t.List[asyncio.Task[t.Any]] = []
+        self._running_tasks: t.Set[asyncio.Task[t.Any]] = set()
 
         if prefix is not None:
             self.subscribe(hikari.MessageCreateEvent, self.handle_message_create_for_prefix_commands)
@@ -310,10 +412,22 @@ class BotApp(hikari.GatewayBot):
         .. versionadded:: 2.2.0
         """
         task: asyncio.Task[None] = asyncio.create_task(coro, name=name)  # type: ignore[arg-type]
-        self._running_tasks.append(task)
-        task.add_done_callback(lambda task_: self._running_tasks.remove(task_))
+        self._running_tasks.add(task)
+        task.add_done_callback(self._running_tasks.discard)
         return task
 
+    @property
+    def get_prefix(self) -> _PrefixGetterT:
+        """The function used to resolve the prefixes for a given message."""
+        return self._get_prefix
+
+    @get_prefix.setter
+    def get_prefix(self, val: _PrefixGetterT) -> None:
+        self._get_prefix = val
+        # Classify the function once here instead of inspecting the return value for every message
+        self._get_prefix_is_async = inspect.iscoroutinefunction(val)
+        self._static_prefix_trie = None
+
     @property
     def help_command(self) -> t.Optional[help_command_.BaseHelpCommand]:
         """The current help command instance registered to the bot."""
@@ -606,6 +720,12 @@ class BotApp(hikari.GatewayBot):
             ext = str(ext_path.with_suffix("")).replace(os.sep, ".")
             self.load_extensions(ext)
 
+    def _get_owner_id_set(self) -> t.AbstractSet[int]:
+        # Rebuilt whenever owner_ids is reassigned, so membership checks don't need to scan the sequence
+        if (cached := self._owner_id_set) is None or cached[0] is not self.owner_ids:
+            cached = self._owner_id_set = (self.owner_ids, frozenset(self.owner_ids))
+        return cached[1]
+
     async def fetch_owner_ids(self) -> t.Sequence[hikari.Snowflakeish]:
         """
         Fetch the bot's owner IDs, or return the given owner IDs on instantiation if provided.
@@ -711,9 +831,13 @@ class BotApp(hikari.GatewayBot):
             Optional[:obj:`~.commands.prefix.PrefixCommand`]: Prefix command object with the given name, or ``None``
                 if not found.
         """
+        # Top level names never contain whitespace, so a direct hit means there is nothing to split
+        if (command := self._prefix_commands.get(name)) is not None:
+            return command
+
         parts = name.split()
         if len(parts) == 1:
-            return self._prefix_commands.get(name)
+            return None
 
         maybe_group = self._prefix_commands.get(parts.pop(0))
         if not isinstance(maybe_group, commands.prefix.PrefixCommandGroup):
@@ -828,15 +952,21 @@ class BotApp(hikari.GatewayBot):
             self._remove_commandlike(command)
             return
 
+        # Only remove entries that still point to this command, so removing a stale command object
+        # does not unregister a different command that has since taken its name or alias
         if isinstance(command, commands.prefix.PrefixCommand):
             for item in [command.name, *command.aliases]:
-                self._prefix_commands.pop(item, None)
+                if self._prefix_commands.get(item) is command:
+                    del self._prefix_commands[item]
         elif isinstance(command, commands.slash.SlashCommand):
-            self._slash_commands.pop(command.name, None)
+            if self._slash_commands.get(command.name) is command:
+                del self._slash_commands[command.name]
         elif isinstance(command, commands.message.MessageCommand):
-            self._message_commands.pop(command.name, None)
+            if self._message_commands.get(command.name) is command:
+                del self._message_commands[command.name]
         elif isinstance(command, commands.user.UserCommand):
-            self._user_commands.pop(command.name, None)
+            if self._user_commands.get(command.name) is command:
+                del self._user_commands[command.name]
 
     def _remove_commandlike(self, cmd_like: commands.base.CommandLike) -> None:
         commands_to_remove: t.List[t.Optional[commands.base.Command]] = []
@@ -938,11 +1068,11 @@ class BotApp(hikari.GatewayBot):
             ``None``
         """
         assert self.application is not None
-        if global_commands:
-            await self.rest.set_application_commands(self.application, ())
-        if guild_ids:
-            for guild_id in guild_ids:
-                await self.rest.set_application_commands(self.application, (), guild_id)
+        # None of these requests depend on each other so they can all be made at once
+        await internal._gather_all(
+            *([self.rest.set_application_commands(self.application, ())] if global_commands else []),
+            *(self.rest.set_application_commands(self.application, (), guild_id) for guild_id in guild_ids),
+        )
 
     async def get_prefix_context(
         self,
@@ -961,46 +1091,42 @@ class BotApp(hikari.GatewayBot):
         Returns:
             Optional[:obj:`~.context.prefix.PrefixContext`]: Prefix context instance for the given event.
         """
-        assert event.message.content is not None
-
-        prefixes = self.get_prefix(self, event.message)
-        if inspect.iscoroutine(prefixes):
-            prefixes = await prefixes
-        prefixes = t.cast(t.Sequence[str], prefixes)
-
-        if isinstance(prefixes, str):
-            prefixes = (prefixes,)
-
-        message = event.message.content
-        if self._case_insensitive_prefixes:
-            message = message.lower()
-            prefixes = tuple(map(str.lower, prefixes))
+        message = event.message
+        content = message.content
+        assert content is not None
 
-        prefixes = sorted(prefixes, key=len, reverse=True)
-
-        invoked_prefix = None
-        for prefix in prefixes:
-            if message.startswith(prefix):
-                invoked_prefix = prefix
-                break
+        case_insensitive = self._case_insensitive_prefixes
 
-        if invoked_prefix is None:
-            return None
-
-        new_content = event.message.content[len(invoked_prefix) :]
-        if not new_content or new_content.isspace():
-            return None
-
-        split_content = new_content.split(maxsplit=1)
-        invoked_with, args = split_content[0], "".join(split_content[1:])
-
-        if not invoked_with:
+        trie = self._static_prefix_trie
+        if trie is not None:
+            # Rejected before the cache so that it only ever holds messages that start with a prefix
+            head = content[: trie.max_length].lower() if case_insensitive else content
+            parsed = _parse_invocation_cached(trie, content, case_insensitive) if trie.has_prefix(head) else None
+        else:
+            prefixes: t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]
+            if self._get_prefix_is_async:
+                prefixes = await self._get_prefix(self, message)  # type: ignore[misc]
+            else:
+                prefixes = self._get_prefix(self, message)
+                # Sync callables are still permitted to return an awaitable
+                if inspect.iscoroutine(prefixes):
+                    prefixes = await prefixes
+            prefixes = t.cast(t.Sequence[str], prefixes)
+
+            if isinstance(prefixes, str):
+                prefixes = (prefixes,)
+
+            invoked_prefix = _match_prefix(prefixes, content, case_insensitive)
+            parsed = None if invoked_prefix is None else _split_invocation(invoked_prefix, content)
+
+        if parsed is None:
             return None
+        invoked_prefix, invoked_with, args = parsed
 
         command = self.get_prefix_command(invoked_with)
         ctx = cls(self, event, command, invoked_with, invoked_prefix)
-        if ctx.command is not None:
-            ctx._parser = (ctx.command.parser or parser.Parser)(ctx, args)
+        if command is not None:
+            ctx._parser = (command.parser or parser.Parser)(ctx, args)
         return ctx
 
     async def process_prefix_commands(self, context: context_.prefix.PrefixContext) -> None:
@@ -1043,33 +1169,34 @@ class BotApp(hikari.GatewayBot):
         if context is None:
             return
 
-        if context.command is not None:
-            await self.dispatch(events.PrefixCommandInvocationEvent(app=self, command=context.command, context=context))
+        command = context.command
+        if command is not None:
+            await self.dispatch(events.PrefixCommandInvocationEvent(app=self, command=command, context=context))
 
         try:
             await self.process_prefix_commands(context)
         except Exception as exc:
             new_exc = exc
             if not isinstance(exc, errors.LightbulbError):
-                assert context.command is not None
+                assert command is not None
                 new_exc = errors.CommandInvocationError(
-                    f"An error occurred during command {context.command.name!r} invocation", original=exc
+                    f"An error occurred during command {command.name!r} invocation", original=exc
                 )
             assert isinstance(new_exc, errors.LightbulbError)
             error_event = events.PrefixCommandErrorEvent(app=self, exception=new_exc, context=context)
             handled = await self.maybe_dispatch_error_event(
                 error_event,
                 [
-                    getattr(context.command, "error_handler", None),
-                    getattr(context.command.plugin, "_error_handler", None) if context.command is not None else None,
+                    getattr(command, "error_handler", None),
+                    getattr(command.plugin, "_error_handler", None) if command is not None else None,
                 ],
             )
 
             if not handled:
                 raise new_exc
         else:
-            assert context.command is not None
-            await self.dispatch(events.PrefixCommandCompletionEvent(app=self, command=context.command, context=context))
+            assert command is not None
+            await self.dispatch(events.PrefixCommandCompletionEvent(app=self, command=command, context=context))
 
     async def get_slash_context(
         self,
@@ -1168,8 +1295,9 @@ class BotApp(hikari.GatewayBot):
         Returns:
             ``None``
         """
-        cmd_events = self._get_events_for_application_command(context.command)
-        await self.dispatch(cmd_events[0](app=self, command=context.command, context=context))
+        command = context.command
+        cmd_events = self._get_events_for_application_command(command)
+        await self.dispatch(cmd_events[0](app=self, command=command, context=context))
 
         try:
             await context.invoke()
@@ -1177,22 +1305,22 @@ class BotApp(hikari.GatewayBot):
             new_exc = exc
             if not isinstance(exc, errors.LightbulbError):
                 new_exc = errors.CommandInvocationError(
-                    f"An error occurred during command {context.command.name!r} invocation", original=exc
+                    f"An error occurred during command {command.name!r} invocation", original=exc
                 )
             assert isinstance(new_exc, errors.LightbulbError)
             error_event = cmd_events[2](app=self, exception=new_exc, context=context)
             handled = await self.maybe_dispatch_error_event(
                 error_event,
                 [
-                    getattr(context.command, "error_handler", None),
-                    getattr(context.command.plugin, "_error_handler", None),
+                    getattr(command, "error_handler", None),
+                    getattr(command.plugin, "_error_handler", None),
                 ],
             )
 
             if not handled:
                 raise new_exc
         else:
-            await self.dispatch(cmd_events[1](app=self, command=context.command, context=context))
+            await self.dispatch(cmd_events[1](app=self, command=command, context=context))
 
     async def handle_interaction_create_for_application_commands(self, event: hikari.InteractionCreateEvent) -> None:
         """
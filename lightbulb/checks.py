@@ -175,10 +175,11 @@ class Check:
 
 
 async def _owner_only(context: context_.base.Context) -> bool:
-    if not context.app.owner_ids:
-        context.app.owner_ids = await context.app.fetch_owner_ids()
+    app = context.app
+    if not app.owner_ids:
+        app.owner_ids = await app.fetch_owner_ids()
 
-    if context.author.id not in context.app.owner_ids:
+    if context.author.id not in app._get_owner_id_set():
         raise errors.NotOwner("You are not the owner of this bot")
     return True
 
@@ -710,8 +710,9 @@ class Command(abc.ABC):
 
     async def __call__(self, context: context_.base.Context, **kwargs: t.Any) -> None:
         if self.pass_options:
-            for opt in context.raw_options:
-                kwargs.setdefault(opt, context.raw_options[opt])
+            raw_options = context.raw_options
+            for opt in raw_options:
+                kwargs.setdefault(opt, raw_options[opt])
         return await self.callback(context, **kwargs)
 
     def _validate_attributes(self) -> None:
@@ -767,24 +768,25 @@ class Command(abc.ABC):
         ...
 
     async def _evaluate_max_concurrency(self, context: context_.base.Context) -> None:
-        if self.max_concurrency is None:
+        if (max_concurrency := self.max_concurrency) is None:
             return
-        bucket_hash = self.max_concurrency[1].extract_hash(context)
-        if bucket_hash not in self._max_concurrency_semaphores:
-            self._max_concurrency_semaphores[bucket_hash] = asyncio.Semaphore(self.max_concurrency[0])
-        if self._max_concurrency_semaphores[bucket_hash].locked():
+        limit, bucket = max_concurrency
+        bucket_hash = bucket.extract_hash(context)
+        if (semaphore := self._max_concurrency_semaphores.get(bucket_hash)) is None:
+            semaphore = self._max_concurrency_semaphores[bucket_hash] = asyncio.Semaphore(limit)
+        if semaphore.locked():
             assert context.invoked is not None
             raise errors.MaxConcurrencyLimitReached(
                 f"Maximum concurrency limit for command '{context.invoked.qualname}' exceeded",
-                bucket=self.max_concurrency[1],
+                bucket=bucket,
             )
-        await self._max_concurrency_semaphores[bucket_hash].acquire()
+        await semaphore.acquire()
 
     def _release_max_concurrency(self, context: context_.base.Context) -> None:
-        if self.max_concurrency is None:
+        if (max_concurrency := self.max_concurrency) is None:
             return
 
-        if sem := self._max_concurrency_semaphores.get(self.max_concurrency[1].extract_hash(context)):
+        if sem := self._max_concurrency_semaphores.get(max_concurrency[1].extract_hash(context)):
             sem.release()
 
     async def invoke(self, context: context_.base.Context, **kwargs: t.Any) -> None:
@@ -799,8 +801,6 @@ class Command(abc.ABC):
             await self.evaluate_checks(context)
             await self.evaluate_cooldowns(context)
             await self(context, **kwargs)
-        except Exception:
-            raise
         finally:
             self._release_max_concurrency(context)
 
@@ -809,16 +809,22 @@ class Command(abc.ABC):
         Evaluate the command's checks under the given context. This method will either return
         ``True`` if all the checks passed, or it will raise :obj:`~.errors.CheckFailure`.
         """
+        parent = self.parent
+        parent_checks = parent.checks if self.inherit_checks and parent is not None else []
+
+        all_checks = [*self.app._checks, *getattr(self.plugin, "_checks", []), *self.checks, *parent_checks]
+        # Most commands have no checks at all, in which case there is nothing to be exempt from
+        if not all_checks:
+            return True
+
         exempt = self.check_exempt(context)
         if inspect.iscoroutine(exempt):
             exempt = await exempt
         if exempt:
             return True
 
-        parent_checks = self.parent.checks if self.inherit_checks and self.parent is not None else []
-
         failed_checks: t.List[errors.CheckFailure] = []
-        for check in [*self.app._checks, *getattr(self.plugin, "_checks", []), *self.checks, *parent_checks]:
+        for check in all_checks:
             try:
                 result = check(context)
                 if inspect.iscoroutine(result):
@@ -826,12 +832,11 @@ class Command(abc.ABC):
 
                 if not result:
                     failed_checks.append(errors.CheckFailure(f"Check {check.__name__} failed for command {self.name}"))
+            except errors.CheckFailure as ex:
+                failed_checks.append(ex)
             except Exception as ex:
-                if not isinstance(ex, errors.CheckFailure):
-                    error = errors.CheckFailure(str(ex))
-                    error.__cause__ = ex
-                else:
-                    error = ex
+                error = errors.CheckFailure(str(ex))
+                error.__cause__ = ex
                 failed_checks.append(error)
 
         if len(failed_checks) > 1:
@@ -848,8 +853,8 @@ class Command(abc.ABC):
         Evaluate the command's cooldown under the given context. This method will either return
         ``None`` if the command is not on cooldown or raise :obj:`.errors.CommandIsOnCooldown`.
         """
-        if self.cooldown_manager is not None:
-            await self.cooldown_manager.add_cooldown(context)
+        if (cooldown_manager := self.cooldown_manager) is not None:
+            await cooldown_manager.add_cooldown(context)
 
 
 class ApplicationCommand(Command, abc.ABC):
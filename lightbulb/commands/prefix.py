@@ -46,14 +46,12 @@ class PrefixGroupMixin(abc.ABC):
     def maybe_resolve_subcommand(
         self, arg_string: str
     ) -> t.Tuple[t.Optional[t.Union[PrefixSubGroup, PrefixSubCommand]], str]:
-        if not arg_string:
+        split_args = arg_string.split(maxsplit=1)
+        if not split_args:
             return None, ""
 
-        maybe_subcmd, *remainder = arg_string.split(maxsplit=1)
-        remainder = "".join(remainder)
-
-        if (cmd := self._subcommands.get(maybe_subcmd)) is not None:
-            return cmd, remainder
+        if (cmd := self._subcommands.get(split_args[0])) is not None:
+            return cmd, split_args[1] if len(split_args) > 1 else ""
         return None, ""
 
     def create_subcommands(self, raw_cmds: t.Sequence[base.CommandLike], app: app_.BotApp) -> None:
@@ -120,8 +118,6 @@ class PrefixCommand(base.Command):
             assert isinstance(context, context_.prefix.PrefixContext)
             context._options = await context._parser.parse()
             await self(context, **kwargs)
-        except Exception:
-            raise
         finally:
             self._release_max_concurrency(context)
 
@@ -214,11 +210,11 @@ class PrefixCommandGroup(PrefixCommand, PrefixGroupMixin):
 
     async def invoke(self, context: context_.base.Context, **kwargs: t.Any) -> None:
         context._invoked = self
-        assert isinstance(context, context_.prefix.PrefixContext) and context.event.message.content is not None
+        assert isinstance(context, context_.prefix.PrefixContext)
 
-        subcmd, remainder = self.maybe_resolve_subcommand(
-            context.event.message.content[len(context.prefix) + len(context.invoked_with) :].strip()
-        )
+        # The parser already holds everything after the invoked name, so there is no need to
+        # slice it out of the message content again
+        subcmd, remainder = self.maybe_resolve_subcommand(context._parser.buffer.strip())
         if subcmd is not None:
             await subcmd.invoke(context, _arg_buffer=remainder)
             return
@@ -29,11 +29,36 @@ import hikari
 from lightbulb import errors
 
 if t.TYPE_CHECKING:
+    import types
+
     from hikari.api import special_endpoints
 
     from lightbulb import app as app_
     from lightbulb import commands
 
+ContextT = t.TypeVar("ContextT", bound="Context")
+
+
+_UNDEFINED: t.Final = hikari.UNDEFINED
+_MESSAGE_CREATE: t.Final = hikari.ResponseType.MESSAGE_CREATE
+_DEFERRED_MESSAGE_CREATE: t.Final = hikari.ResponseType.DEFERRED_MESSAGE_CREATE
+_DEFERRED_RESPONSE_TYPES: t.Final = frozenset((_DEFERRED_MESSAGE_CREATE, hikari.ResponseType.DEFERRED_MESSAGE_UPDATE))
+_EPHEMERAL: t.Final = hikari.MessageFlag.EPHEMERAL
+_NO_FLAGS: t.Final = hikari.MessageFlag.NONE
+
+
+def _includes_ephemeral(flags: t.Union[hikari.MessageFlag, int]) -> bool:
+    return (_EPHEMERAL & flags) == _EPHEMERAL
+
+
+async def _delete_after(timeout: t.Union[int, float], proxy: ResponseProxy) -> None:
+    await asyncio.sleep(timeout)
+
+    try:
+        await proxy.delete()
+    except hikari.NotFoundError:
+        pass
+
 
 class OptionsProxy:
     """
@@ -81,7 +106,7 @@ class ResponseProxy:
     lazily instead of a follow-up request being made immediately.
     """
 
-    __slots__ = ("_message", "_fetcher", "_editor", "_editable", "_deleteable")
+    __slots__ = ("_message", "_fetcher", "_fetch", "_editor", "_deleter", "_editable", "_deleteable")
 
     def __init__(
         self,
@@ -89,13 +114,16 @@ class ResponseProxy:
         fetcher: t.Optional[t.Callable[[], t.Coroutine[t.Any, t.Any, hikari.Message]]] = None,
         editor: t.Optional[t.Callable[[ResponseProxy], t.Coroutine[t.Any, t.Any, hikari.Message]]] = None,
         deleteable: bool = True,
+        deleter: t.Optional[t.Callable[[], t.Coroutine[t.Any, t.Any, None]]] = None,
     ) -> None:
         if message is None and fetcher is None:
             raise ValueError("One of message or fetcher arguments cannot be None")
 
         self._message = message
         self._fetcher = fetcher
+        self._fetch: t.Optional[asyncio.Future[hikari.Message]] = None
         self._editor = editor
+        self._deleter = deleter
         self._deleteable = deleteable
 
         if editor is None:
@@ -129,9 +157,29 @@ class ResponseProxy:
         """
         if self._message is not None:
             return self._message
-        assert self._fetcher is not None
-        msg = await self._fetcher()
-        return msg
+
+        # The created message doesn't change unless it is edited, so only fetch it once and
+        # share the request between everything waiting on it at the same time
+        if (fetch := self._fetch) is None:
+            assert self._fetcher is not None
+            fetch = self._fetch = asyncio.ensure_future(self._fetcher())
+            fetch.add_done_callback(self._fetch_done)
+
+        # Shielded so that one cancelled caller doesn't cancel the fetch for everyone else
+        return await asyncio.shield(fetch)
+
+    def _fetch_done(self, fetch: asyncio.Future[hikari.Message]) -> None:
+        # Always retrieve the result, even if every caller was cancelled before the fetch finished
+        failed = fetch.cancelled() or fetch.exception() is not None
+        if self._fetch is fetch:
+            # A failed fetch is cleared so that the next call can try again
+            self._fetch = None
+            if not failed:
+                self._message = fetch.result()
+
+    def _invalidate(self) -> None:
+        self._message = None
+        self._fetch = None
 
     async def edit(self, *args: t.Any, **kwargs: t.Any) -> hikari.Message:
         """
@@ -151,6 +199,7 @@ class ResponseProxy:
         assert self._editor is not None
         out = await self._editor(self, *args, **kwargs)
         assert isinstance(out, hikari.Message)
+        self._message, self._fetch = out, None
         return out
 
     async def delete(self) -> None:
@@ -167,6 +216,11 @@ class ResponseProxy:
         if not self._deleteable:
             raise errors.UnsupportedResponseOperation("This response does not support deleting.")
 
+        if self._deleter is not None:
+            # Avoids having to fetch the message just to delete it
+            await self._deleter()
+            return
+
         msg = await self.message()
         await msg.delete()
 
@@ -179,7 +233,7 @@ class Context(abc.ABC):
         app (:obj:`~.app.BotApp`): The ``BotApp`` instance that the context is linked to.
     """
 
-    __slots__ = ("_app", "_responses", "_responded", "_deferred", "_invoked")
+    __slots__ = ("_app", "_responses", "_responded", "_deferred", "_invoked", "_options_proxy", "_pending_tasks")
 
     def __init__(self, app: app_.BotApp):
         self._app = app
@@ -187,6 +241,44 @@ class Context(abc.ABC):
         self._responded: bool = False
         self._deferred: bool = False
         self._invoked: t.Optional[commands.base.Command] = None
+        self._options_proxy: t.Optional[OptionsProxy] = None
+        self._pending_tasks: t.Set[asyncio.Task[t.Any]] = set()
+
+    def _create_task(self, coro: t.Awaitable[t.Any]) -> asyncio.Task[t.Any]:
+        task = self.app.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    async def close(self) -> None:
+        """
+        Cancels the deletion of any responses from this context that are still waiting for their
+        ``delete_after`` delay to pass, and waits for the cancellations to finish. This is also called
+        automatically when the context is used as an async context manager (``async with ctx: ...``).
+
+        Returns:
+            ``None``
+
+        .. versionadded:: 2.3.6
+        """
+        if not self._pending_tasks:
+            return
+
+        tasks = list(self._pending_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self: ContextT) -> ContextT:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc_val: t.Optional[BaseException],
+        exc_tb: t.Optional[types.TracebackType],
+    ) -> None:
+        await self.close()
 
     @abc.abstractmethod
     async def _maybe_defer(self) -> None:
@@ -243,7 +335,12 @@ class Context(abc.ABC):
     @property
     def options(self) -> OptionsProxy:
         """:obj:`~OptionsProxy` wrapping the options that the user invoked the command with."""
-        return OptionsProxy(self.raw_options)
+        raw_options = self.raw_options
+        # The options dict can be replaced during invocation (e.g. once prefix command arguments
+        # have been parsed) so the cached proxy is only reused while it still wraps the same dict
+        if (proxy := self._options_proxy) is None or proxy._options is not raw_options:
+            proxy = self._options_proxy = OptionsProxy(raw_options)
+        return proxy
 
     @property
     @abc.abstractmethod
@@ -411,10 +508,10 @@ class Context(abc.ABC):
             Optional[:obj:`~hikari.messages.Message`]: New message after edit, or ``None`` if no responses have
                 been sent for the context yet.
         """
-        if not self._responses:
+        if (response := self.previous_response) is None:
             return None
 
-        return await self._responses[-1].edit(*args, **kwargs)
+        return await response.edit(*args, **kwargs)
 
     async def delete_last_response(self) -> None:
         """
@@ -445,23 +542,60 @@ class Context(abc.ABC):
 
 
 class ApplicationContext(Context, abc.ABC):
-    __slots__ = ("_event", "_interaction", "_command")
+    __slots__ = (
+        "_event",
+        "_interaction",
+        "_command",
+        "_initial_response",
+        "_channel_id",
+        "_guild_id",
+        "_member",
+        "_author",
+    )
 
     def __init__(
         self, app: app_.BotApp, event: hikari.InteractionCreateEvent, command: commands.base.ApplicationCommand
     ) -> None:
         super().__init__(app)
         self._event = event
-        assert isinstance(event.interaction, hikari.CommandInteraction)
-        self._interaction: hikari.CommandInteraction = event.interaction
+        # Application contexts are only ever created for command interactions, the app checks
+        # the interaction type before dispatching so there is no need to check it again here
+        self._interaction = interaction = t.cast(hikari.CommandInteraction, event.interaction)
         self._command = command
+        # Cached as they are read repeatedly by checks and cooldown buckets
+        self._channel_id: hikari.Snowflake = interaction.channel_id
+        self._guild_id: t.Optional[hikari.Snowflake] = interaction.guild_id
+        self._member: t.Optional[hikari.Member] = interaction.member
+        self._author: hikari.User = interaction.user
+        self._initial_response: t.Optional[ResponseProxy] = None
 
     async def _maybe_defer(self) -> None:
         if self._deferred:
             return
 
         if (self._invoked or self._command).auto_defer:
-            await self.respond(hikari.ResponseType.DEFERRED_MESSAGE_CREATE)
+            await self.respond(_DEFERRED_MESSAGE_CREATE)
+
+    async def _edit_initial_response(self, _: ResponseProxy, *args: t.Any, **kwargs: t.Any) -> hikari.Message:
+        return await self._interaction.edit_initial_response(*args, **kwargs)
+
+    async def _edit_followup(
+        self, _: ResponseProxy, *args: t.Any, _m_id: hikari.Snowflake, **kwargs: t.Any
+    ) -> hikari.Message:
+        interaction = self._interaction
+        return await self._app.rest.edit_webhook_message(
+            interaction.webhook_id, interaction.token, _m_id, *args, **kwargs
+        )
+
+    def _create_initial_response_proxy(self, ephemeral: bool) -> ResponseProxy:
+        # Initial responses are special and need their own edit method defined
+        # so that they work as expected for when the responses are ephemeral
+        self._initial_response = ResponseProxy(
+            fetcher=self._interaction.fetch_initial_response,
+            editor=self._edit_initial_response if ephemeral else None,
+            deleter=self._interaction.delete_initial_response,
+        )
+        return self._initial_response
 
     @property
     @abc.abstractmethod
@@ -478,11 +612,11 @@ class ApplicationContext(Context, abc.ABC):
 
     @property
     def channel_id(self) -> hikari.Snowflake:
-        return self._interaction.channel_id
+        return self._channel_id
 
     @property
     def guild_id(self) -> t.Optional[hikari.Snowflake]:
-        return self._interaction.guild_id
+        return self._guild_id
 
     @property
     def attachments(self) -> t.Sequence[hikari.Attachment]:
@@ -490,11 +624,11 @@ class ApplicationContext(Context, abc.ABC):
 
     @property
     def member(self) -> t.Optional[hikari.Member]:
-        return self._interaction.member
+        return self._member
 
     @property
     def author(self) -> hikari.User:
-        return self._interaction.user
+        return self._author
 
     @property
     def invoked_with(self) -> str:
@@ -540,98 +674,62 @@ class ApplicationContext(Context, abc.ABC):
             ``delete_after`` kwarg.
         """  # noqa: E501
 
-        async def _cleanup(timeout: t.Union[int, float], proxy_: ResponseProxy) -> None:
-            await asyncio.sleep(timeout)
-
-            try:
-                await proxy_.delete()
-            except hikari.NotFoundError:
-                pass
-
-        def includes_ephemeral(flags: t.Union[hikari.MessageFlag, int]) -> bool:
-            return (hikari.MessageFlag.EPHEMERAL & flags) == hikari.MessageFlag.EPHEMERAL
-
         kwargs.pop("reply", None)
         kwargs.pop("mentions_reply", None)
         kwargs.pop("nonce", None)
 
         if (self._invoked or self._command).default_ephemeral:
-            kwargs.setdefault("flags", hikari.MessageFlag.EPHEMERAL)
+            kwargs.setdefault("flags", _EPHEMERAL)
+
+        # Work out once whether the response type was passed positionally, both branches below need to know
+        response_type: hikari.UndefinedOr[hikari.ResponseType] = _UNDEFINED
+        if args and isinstance(args[0], hikari.ResponseType):
+            response_type, args = args[0], args[1:]
 
         if self._responded:
             kwargs.pop("response_type", None)
-            if args and isinstance(args[0], hikari.ResponseType):
-                args = args[1:]
-
-            async def _ephemeral_followup_editor(
-                _: ResponseProxy,
-                *args_: t.Any,
-                _wh_id: hikari.Snowflake,
-                _tkn: str,
-                _m_id: hikari.Snowflake,
-                **kwargs_: t.Any,
-            ) -> hikari.Message:
-                return await self.app.rest.edit_webhook_message(_wh_id, _tkn, _m_id, *args_, **kwargs_)
-
-            message = await self._interaction.execute(*args, **kwargs)
-            proxy = ResponseProxy(
-                message,
-                editor=functools.partial(
-                    _ephemeral_followup_editor,
-                    _wh_id=self._interaction.webhook_id,
-                    _tkn=self._interaction.token,
-                    _m_id=message.id,
-                ),
-                deleteable=not includes_ephemeral(kwargs.get("flags", hikari.MessageFlag.NONE)),
-            )
-            self._responses.append(proxy)
-            self._deferred = False
-
-            if delete_after is not None:
-                self.app.create_task(_cleanup(delete_after, proxy))
-
-            return self._responses[-1]
-
-        if args:
-            if not isinstance(args[0], hikari.ResponseType):
-                kwargs["content"] = args[0]
-                kwargs.setdefault("response_type", hikari.ResponseType.MESSAGE_CREATE)
-            else:
-                kwargs["response_type"] = args[0]
-                if len(args) > 1:
-                    kwargs.setdefault("content", args[1])
+            proxy = await self._send_followup(args, kwargs)
         else:
-            kwargs.setdefault("response_type", hikari.ResponseType.MESSAGE_CREATE)
+            if response_type is not _UNDEFINED:
+                kwargs["response_type"] = response_type
+                if args:
+                    kwargs.setdefault("content", args[0])
+            else:
+                if args:
+                    kwargs["content"] = args[0]
+                kwargs.setdefault("response_type", _MESSAGE_CREATE)
+            proxy = await self._send_initial_response(kwargs)
 
-        await self._interaction.create_initial_response(**kwargs)
+        if delete_after is not None:
+            self._create_task(_delete_after(delete_after, proxy))
 
-        # Initial responses are special and need their own edit method defined
-        # so that they work as expected for when the responses are ephemeral
-        async def _editor(
-            rp: ResponseProxy, *args_: t.Any, inter: hikari.CommandInteraction, **kwargs_: t.Any
-        ) -> hikari.Message:
-            await inter.edit_initial_response(*args_, **kwargs_)
-            return await rp.message()
+        return proxy
 
+    async def _send_followup(self, args: t.Sequence[t.Any], kwargs: t.Dict[str, t.Any]) -> ResponseProxy:
+        message = await self._interaction.execute(*args, **kwargs)
         proxy = ResponseProxy(
-            fetcher=self._interaction.fetch_initial_response,
-            editor=functools.partial(_editor, inter=self._interaction)
-            if includes_ephemeral(kwargs.get("flags", hikari.MessageFlag.NONE))
-            else None,
+            message,
+            editor=functools.partial(self._edit_followup, _m_id=message.id),
+            deleteable=not _includes_ephemeral(kwargs.get("flags", _NO_FLAGS)),
         )
         self._responses.append(proxy)
+        if self._deferred and self._initial_response is not None:
+            # The first followup replaces the deferred response, so any message cached
+            # for the initial response is now out of date
+            self._initial_response._invalidate()
+        self._deferred = False
+        return proxy
+
+    async def _send_initial_response(self, kwargs: t.Dict[str, t.Any]) -> ResponseProxy:
+        await self._interaction.create_initial_response(**kwargs)
+
+        proxy = self._create_initial_response_proxy(_includes_ephemeral(kwargs.get("flags", _NO_FLAGS)))
+        self._responses.append(proxy)
         self._responded = True
 
-        if kwargs["response_type"] in (
-            hikari.ResponseType.DEFERRED_MESSAGE_CREATE,
-            hikari.ResponseType.DEFERRED_MESSAGE_UPDATE,
-        ):
+        if kwargs["response_type"] in _DEFERRED_RESPONSE_TYPES:
             self._deferred = True
-
-        if delete_after is not None:
-            self.app.create_task(_cleanup(delete_after, proxy))
-
-        return self._responses[-1]
+        return proxy
 
     async def respond_with_modal(
         self,
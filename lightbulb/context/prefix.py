@@ -19,7 +19,6 @@ from __future__ import annotations
 
 __all__ = ["PrefixContext"]
 
-import asyncio
 import typing as t
 
 import hikari
@@ -47,7 +46,18 @@ class PrefixContext(base.Context):
         prefix (:obj:`str`): The prefix that was used in this context.
     """
 
-    __slots__ = ("_parser", "_event", "_command", "_invoked_with", "_prefix", "_options")
+    __slots__ = (
+        "_parser",
+        "_event",
+        "_command",
+        "_invoked_with",
+        "_prefix",
+        "_options",
+        "_channel_id",
+        "_guild_id",
+        "_member",
+        "_author",
+    )
 
     def __init__(
         self,
@@ -64,6 +74,11 @@ class PrefixContext(base.Context):
         self._prefix = prefix
         self._options: t.Dict[str, t.Any] = {}
         self._parser: parser.BaseParser
+        message = event.message
+        self._channel_id: hikari.Snowflake = message.channel_id
+        self._guild_id: t.Optional[hikari.Snowflake] = message.guild_id
+        self._member: t.Optional[hikari.Member] = message.member
+        self._author: hikari.User = message.author
 
     async def _maybe_defer(self) -> None:
         if self._deferred:
@@ -83,11 +98,11 @@ class PrefixContext(base.Context):
 
     @property
     def channel_id(self) -> hikari.Snowflake:
-        return self.event.message.channel_id
+        return self._channel_id
 
     @property
     def guild_id(self) -> t.Optional[hikari.Snowflake]:
-        return self.event.message.guild_id
+        return self._guild_id
 
     @property
     def attachments(self) -> t.Sequence[hikari.Attachment]:
@@ -95,11 +110,11 @@ class PrefixContext(base.Context):
 
     @property
     def member(self) -> t.Optional[hikari.Member]:
-        return self.event.message.member
+        return self._member
 
     @property
     def author(self) -> hikari.User:
-        return self.event.message.author
+        return self._author
 
     @property
     def invoked_with(self) -> str:
@@ -146,21 +161,13 @@ class PrefixContext(base.Context):
             args = args[1:]
 
         msg = await self._event.message.respond(*args, **kwargs)
+        proxy = base.ResponseProxy(msg)
         if delete_after is not None:
+            self._create_task(base._delete_after(delete_after, proxy))
 
-            async def _cleanup(timeout: t.Union[int, float]) -> None:
-                await asyncio.sleep(timeout)
-
-                try:
-                    await msg.delete()
-                except hikari.NotFoundError:
-                    pass
-
-            self.app.create_task(_cleanup(delete_after))
-
-        self._responses.append(base.ResponseProxy(msg))
+        self._responses.append(proxy)
         self._responded = True
-        return self._responses[-1]
+        return proxy
 
     async def respond_with_modal(
         self,
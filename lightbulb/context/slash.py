@@ -33,6 +33,13 @@ from lightbulb.converters import BaseConverter
 if t.TYPE_CHECKING:
     from lightbulb import app as app_
 
+_USER: t.Final = hikari.OptionType.USER
+_CHANNEL: t.Final = hikari.OptionType.CHANNEL
+_ROLE: t.Final = hikari.OptionType.ROLE
+_ATTACHMENT: t.Final = hikari.OptionType.ATTACHMENT
+# Option types whose values should be replaced by the matching object from the resolved data
+_RESOLVABLE_OPTION_TYPES: t.Final = frozenset((_USER, _CHANNEL, _ROLE, _ATTACHMENT))
+
 
 class SlashContext(base.ApplicationContext):
     """
@@ -73,30 +80,33 @@ class SlashContext(base.ApplicationContext):
 
     def _parse_options(self, options: t.Optional[t.Sequence[hikari.CommandInteractionOption]]) -> None:
         # We need to clear the options here to ensure the subcommand name does not exist in the mapping
-        self._options.clear()
+        parsed = self._options
+        parsed.clear()
+        resolved = self.resolved
         for opt in options or []:
-            # Why is mypy so annoying about this ??
-            if opt.type is hikari.OptionType.USER and self.resolved is not None:
+            opt_type = opt.type
+            if resolved is None or opt_type not in _RESOLVABLE_OPTION_TYPES:
+                if isinstance(opt.value, str):
+                    self._to_convert.append(self._convert_option(opt.name, opt.value))
+                    continue
+                parsed[opt.name] = opt.value
+            elif opt_type is _USER:
+                # Why is mypy so annoying about this ??
                 val = t.cast(hikari.Snowflake, opt.value)
-                self._options[opt.name] = self.resolved.members.get(val, self.resolved.users.get(val, opt.value))
-            elif opt.type is hikari.OptionType.CHANNEL and self.resolved is not None:
+                parsed[opt.name] = resolved.members.get(val, resolved.users.get(val, opt.value))
+            elif opt_type is _CHANNEL:
                 val = t.cast(hikari.Snowflake, opt.value)
-                self._options[opt.name] = self.resolved.channels.get(val, opt.value)
-            elif opt.type is hikari.OptionType.ROLE and self.resolved is not None:
+                parsed[opt.name] = resolved.channels.get(val, opt.value)
+            elif opt_type is _ROLE:
                 val = t.cast(hikari.Snowflake, opt.value)
-                self._options[opt.name] = self.resolved.roles.get(val, opt.value)
-            elif opt.type is hikari.OptionType.ATTACHMENT and self.resolved is not None:
-                val = t.cast(hikari.Snowflake, int(opt.value) if isinstance(opt.value, str) else opt.value)
-                self._options[opt.name] = self.resolved.attachments.get(val, opt.value)
+                parsed[opt.name] = resolved.roles.get(val, opt.value)
             else:
-                if isinstance(opt.value, str):
-                    self._to_convert.append(self._convert_option(opt.name, opt.value))
-                    continue
-                self._options[opt.name] = opt.value
+                val = t.cast(hikari.Snowflake, int(opt.value) if isinstance(opt.value, str) else opt.value)
+                parsed[opt.name] = resolved.attachments.get(val, opt.value)
 
         cmd = self.invoked or self.command
         for opt in cmd.options.values():
-            self._options.setdefault(opt.name, opt.default if opt.default is not hikari.UNDEFINED else None)
+            parsed.setdefault(opt.name, opt.default if opt.default is not base._UNDEFINED else None)
 
     async def _maybe_defer(self) -> None:
         await super()._maybe_defer()
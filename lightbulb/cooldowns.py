@@ -89,7 +89,7 @@ class CooldownManager:
                 return
 
         self.cooldowns[cooldown_hash] = bucket
-        maybe_coro = self.cooldowns[cooldown_hash].acquire()
+        maybe_coro = bucket.acquire()
         if inspect.iscoroutine(maybe_coro):
             await maybe_coro
 
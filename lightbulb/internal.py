@@ -19,6 +19,7 @@ from __future__ import annotations
 
 __all__ = ["serialise_command", "manage_application_commands"]
 
+import asyncio
 import logging
 import typing as t
 
@@ -269,6 +270,26 @@ async def _process_global_commands(app: app_.BotApp) -> None:
     )
 
 
+async def _gather_all(*aws: t.Awaitable[t.Any]) -> None:
+    # Unlike a plain gather, a failure doesn't leave the remaining requests running unobserved
+    # in the background - every request is allowed to finish before the first error is raised
+    for result in await asyncio.gather(*aws, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def _set_guild_commands(
+    app: app_.BotApp, guild_id: int, cmd_mapping: t.Dict[hikari.CommandType, t.Dict[str, base.ApplicationCommand]]
+) -> None:
+    assert app.application is not None
+
+    cmds_to_declare = await _get_guild_commands_to_set(app, guild_id)
+    created = await app.rest.set_application_commands(app.application, cmds_to_declare, guild_id)
+    for created_cmd in created:
+        if equiv := cmd_mapping[created_cmd.type].get(created_cmd.name):
+            equiv.instances[guild_id] = created_cmd
+
+
 async def manage_application_commands(app: app_.BotApp) -> None:
     assert app.application is not None
 
@@ -283,12 +304,8 @@ async def manage_application_commands(app: app_.BotApp) -> None:
         hikari.CommandType.USER: app._user_commands,  # type: ignore[dict-item]
         hikari.CommandType.MESSAGE: app._message_commands,  # type: ignore[dict-item]
     }
-    for guild_id in all_guilds:
-        cmds_to_declare = await _get_guild_commands_to_set(app, guild_id)
-        created = await app.rest.set_application_commands(app.application, cmds_to_declare, guild_id)
-        for created_cmd in created:
-            if equiv := cmd_mapping[created_cmd.type].get(created_cmd.name):
-                equiv.instances[guild_id] = created_cmd
+    # Each guild's commands are independent of every other guild's, so sync them concurrently
+    await _gather_all(*(_set_guild_commands(app, guild_id, cmd_mapping) for guild_id in all_guilds))
 
     # Global command processing
     _LOGGER.info("Processing global application commands")
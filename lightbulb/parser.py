@@ -22,6 +22,7 @@ __all__ = ["BaseParser", "Parser"]
 import abc
 import inspect
 import logging
+import re
 import typing as t
 
 import hikari
@@ -55,6 +56,8 @@ _quotes = {
     "《": "》",
     "〈": "〉",
 }
+_WHITESPACE_REGEX: re.Pattern[str] = re.compile(r"\s")
+_NON_WHITESPACE_REGEX: re.Pattern[str] = re.compile(r"\S")
 _LOGGER = logging.getLogger("lightbulb.utils.parser")
 
 
@@ -134,11 +137,15 @@ class Parser(BaseParser):
         return None
 
     def skip_ws(self) -> None:
-        prev = self.idx
-        if (char := self.get_current()) is not None and not char.isspace():
+        prev = self._idx
+        if prev >= self.len:
+            self._idx = prev + 1
+        elif not self.buffer[prev].isspace():
             return None
-        while (char := self.get_char()) is not None and char.isspace():
-            pass
+        else:
+            # Let the regex engine find the end of the whitespace instead of stepping through it char by char
+            match = _NON_WHITESPACE_REGEX.search(self.buffer, prev)
+            self._idx = match.start() if match is not None else self.len
         self.prev = prev
 
     def get_char(self) -> t.Optional[str]:
@@ -154,30 +161,37 @@ class Parser(BaseParser):
     def get_word(self) -> str:
         """Gets the next word, will return an empty string if EOF."""
         self.skip_ws()
-        prev = self.idx
-        while (char := self.get_char()) is not None and not char.isspace():
-            pass
+        prev = self._idx
+        if prev >= self.len:
+            self._idx = prev + 1
+        else:
+            match = _WHITESPACE_REGEX.search(self.buffer, prev + 1)
+            self._idx = match.start() if match is not None else self.len
         self.prev = prev
-        return self.buffer[prev : self.idx]
+        return self.buffer[prev : self._idx]
 
     def get_quoted_word(self) -> str:
         self.skip_ws()
-        prev = self.idx
+        prev = self._idx
         if (closing := _quotes.get(t.cast(str, self.get_current()))) is None:
             return self.get_word()
 
-        while (char := self.get_char()) is not None:
-            if char == closing and self.get_previous() != "\\":
+        buffer = self.buffer
+        end = prev
+        while True:
+            if (end := buffer.find(closing, end + 1)) == -1:
+                # EOF
+                self.prev, self._idx = self.len - 1, self.len
+                raise RuntimeError("expected a closing quote")  # TODO: raise proper error
+            if buffer[end - 1] != "\\":
                 break
-        else:
-            # EOF
-            raise RuntimeError("expected a closing quote")  # TODO: raise proper error
 
-        if (current := self.get_char()) is not None and not current.isspace():
+        self.prev, self._idx = end, end + 1
+        if self._idx < self.len and not buffer[self._idx].isspace():
             raise RuntimeError("expected a space after the closing quote")  # TODO: raise proper error
 
         self.prev = prev
-        return self.buffer[prev + 1 : self.idx - 1].replace(f"\\{closing}", closing)
+        return buffer[prev + 1 : end].replace(f"\\{closing}", closing)
 
     def read_rest(self) -> str:
         self.skip_ws()